@@ -1,13 +1,40 @@
 import os
 import platform
 import hashlib
+import hmac
 import tkinter as tk
 from tkinter import ttk, messagebox
 import subprocess
 import re
+import ast
 import math
+import operator
+from collections import OrderedDict
+from functools import lru_cache
 from tkinter import font
 
+# Characters allowed in a calculator expression, compiled once.
+_VALID_EXPR = re.compile(r'^[\d+\-×÷/().\s]+$')
+
+# Display glyphs to Python operators, applied in one translate() pass.
+_EXPR_TRANS = str.maketrans({'×': '*', '÷': '/'})
+
+# Two-digit hex strings for every byte value, so color formatting is a
+# table lookup instead of three :02x fields per scanline.
+_HEX = tuple(f"{v:02x}" for v in range(256))
+
+# Operators the expression evaluator understands.
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
 def create_hidden_folder(folder_name=".secret_folder"):
     """
     Create a hidden folder if it doesn't exist.
@@ -30,9 +57,11 @@ def hash_password(password):
     """Return SHA-256 hash of the password."""
     return hashlib.sha256(password.encode()).hexdigest()
 
-def verify_password(stored_hash, input_password):
-    """Check if input_password matches the stored hash."""
-    return stored_hash == hash_password(input_password)
+def verify_password(stored_digest, input_password):
+    """Check if input_password matches the stored digest, in constant time."""
+    return hmac.compare_digest(
+        stored_digest, hashlib.sha256(input_password.encode()).digest()
+    )
 
 def open_folder(folder_path):
     """Open the folder in the system's file explorer."""
@@ -48,9 +77,97 @@ def open_folder(folder_path):
     except Exception as e:
         messagebox.showerror("Error", f"Error opening folder: {e}")
 
-def draw_rounded_rect(canvas, x, y, width, height, radius, **kwargs):
-    """Draw a rounded rectangle on a canvas."""
-    points = [
+def _eval_node(node):
+    """Evaluate one node of a parsed arithmetic expression."""
+    if isinstance(node, ast.BinOp):
+        op = _BIN_OPS.get(type(node.op))
+        if op is not None:
+            return op(_eval_node(node.left), _eval_node(node.right))
+    elif isinstance(node, ast.UnaryOp):
+        op = _UNARY_OPS.get(type(node.op))
+        if op is not None:
+            return op(_eval_node(node.operand))
+    elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    raise ValueError("Unsupported expression")
+
+@lru_cache(maxsize=64)
+def evaluate_expression(expression):
+    """Evaluate an arithmetic expression restricted to numbers and + - * /.
+
+    Cheaper and safer than eval(): only numeric constants and arithmetic
+    operators are accepted. Results are cached so pressing = again on the
+    same expression is free.
+    """
+    return _eval_node(ast.parse(expression, mode="eval").body)
+
+def gradient_colors(height):
+    """Compute the per-scanline gradient colors in a single pass."""
+    r_step = 15 / height
+    g_step = 20 / height
+    b_step = 25 / height
+    return [
+        '#' + _HEX[10 + int(i * r_step)] + _HEX[16 + int(i * g_step)] + _HEX[30 + int(i * b_step)]
+        for i in range(height)
+    ]
+
+def _password_gradient_data(width=500, height=350):
+    """Raw PPM bytes for the fixed-size password dialog background.
+
+    Each scanline is one color repeated across the row, so the whole
+    raster is assembled with a bytes-multiply per row and handed to Tk
+    as a single P6 blob. Tk's PPM reader wants the raw bytes, not
+    base64.
+    """
+    r_step = 15 / height
+    g_step = 20 / height
+    b_step = 25 / height
+    rows = bytearray()
+    for i in range(height):
+        rows += bytes((10 + int(i * r_step),
+                       16 + int(i * g_step),
+                       30 + int(i * b_step))) * width
+    return f"P6 {width} {height} 255 ".encode() + bytes(rows)
+
+def make_gradient_image(width, height):
+    """Build the premium gradient as a single PhotoImage.
+
+    Renders a one-pixel-wide column of the gradient and zooms it to the
+    target width, so the whole background costs one canvas item instead
+    of one line item per scanline.
+    """
+    colors = gradient_colors(height)
+    column = tk.PhotoImage(width=1, height=height)
+    column.put(" ".join("{" + color + "}" for color in colors), (0, 0))
+    return column.zoom(width, 1)
+
+@lru_cache(maxsize=32)
+def lighten_color(color):
+    """Return the hover variant of a hex color, memoized."""
+    r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    r = min(255, r + 50)
+    g = min(255, g + 50)
+    b = min(255, b + 50)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+@lru_cache(maxsize=32)
+def darken_color(color):
+    """Return the pressed variant of a hex color, memoized."""
+    r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    r = max(0, r - 50)
+    g = max(0, g - 50)
+    b = max(0, b - 50)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+@lru_cache(maxsize=16)
+def _rrect_points(x, y, width, height, radius):
+    """Point list for a rounded rectangle, cached per geometry.
+
+    The keypad reuses a handful of button sizes, so the 18-element list
+    is built once per (x, y, width, height, radius) instead of twice per
+    button.
+    """
+    return (
         x + radius, y,
         x + width - radius, y,
         x + width, y + radius,
@@ -60,7 +177,11 @@ def draw_rounded_rect(canvas, x, y, width, height, radius, **kwargs):
         x, y + height - radius,
         x, y + radius,
         x + radius, y
-    ]
+    )
+
+def draw_rounded_rect(canvas, x, y, width, height, radius, **kwargs):
+    """Draw a rounded rectangle on a canvas."""
+    points = _rrect_points(x, y, width, height, radius)
     return canvas.create_polygon(points, **kwargs, smooth=True)
 
 class PasswordWindow(tk.Toplevel):
@@ -72,10 +193,16 @@ class PasswordWindow(tk.Toplevel):
         self.geometry("500x350")
         self.configure(bg="#0a101e")
         self.resizable(False, False)
-        self.stored_hash = stored_hash
+        try:
+            self.stored_digest = bytes.fromhex(stored_hash)
+        except ValueError:
+            # Corrupt or truncated hash on disk: deny every attempt
+            # instead of crashing mid-construction
+            self.stored_digest = b""
         self.max_attempts = max_attempts
         self.attempts = 0
         self.on_success_callback = on_success_callback
+        self._verify_cache = {}
 
         # Center the window
         self.update_idletasks()
@@ -91,13 +218,9 @@ class PasswordWindow(tk.Toplevel):
         main_frame = tk.Canvas(self, width=500, height=350, bg="#0a101e", highlightthickness=0)
         main_frame.pack(fill="both", expand=True)
         
-        # Draw premium gradient background
-        for i in range(350):
-            r = int(10 + (i/350)*15)
-            g = int(16 + (i/350)*20)
-            b = int(30 + (i/350)*25)
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            main_frame.create_line(0, i, 500, i, fill=color)
+        # Draw premium gradient background from a single pre-built PPM blob
+        self._grad_img = tk.PhotoImage(data=_password_gradient_data(), format="PPM")
+        main_frame.create_image(0, 0, anchor="nw", image=self._grad_img)
 
         # Add subtle glow effect
         main_frame.create_oval(50, 50, 450, 300, fill="", outline="#00d4ff", width=1, stipple="gray25")
@@ -127,43 +250,65 @@ class PasswordWindow(tk.Toplevel):
         main_frame.create_window(250, 280, window=btn_frame, width=350, height=60)
 
         # Submit button with animation
-        submit_btn = tk.Canvas(btn_frame, width=160, height=50, bg="#0a101e", highlightthickness=0)
-        submit_btn.pack(side="left", padx=(0, 15))
-        draw_rounded_rect(submit_btn, 0, 0, 160, 50, 20, fill="#00d4ff", outline="")
-        submit_btn.create_text(80, 25, text="Unlock", fill="#0a101e", font=("Helvetica Neue", 14, "bold"))
-        submit_btn.bind("<Button-1>", lambda e: self.verify())
-        submit_btn.bind("<Enter>", lambda e: [submit_btn.configure(cursor="hand2"), 
-                                             submit_btn.itemconfig(1, fill="#33eaff")])
-        submit_btn.bind("<Leave>", lambda e: [submit_btn.configure(cursor=""), 
-                                             submit_btn.itemconfig(1, fill="#00d4ff")])
+        self._submit_btn = tk.Canvas(btn_frame, width=160, height=50, bg="#0a101e", highlightthickness=0)
+        self._submit_btn.pack(side="left", padx=(0, 15))
+        self._submit_rect = draw_rounded_rect(self._submit_btn, 0, 0, 160, 50, 20, fill="#00d4ff", outline="")
+        self._submit_btn.create_text(80, 25, text="Unlock", fill="#0a101e", font=("Helvetica Neue", 14, "bold"))
+        self._submit_btn.bind("<Button-1>", lambda e: self.verify())
+        self._submit_btn.bind("<Enter>", self._on_submit_enter)
+        self._submit_btn.bind("<Leave>", self._on_submit_leave)
 
         # Cancel button with animation
-        cancel_btn = tk.Canvas(btn_frame, width=160, height=50, bg="#0a101e", highlightthickness=0)
-        cancel_btn.pack(side="right", padx=(15, 0))
-        draw_rounded_rect(cancel_btn, 0, 0, 160, 50, 20, fill="#64748b", outline="")
-        cancel_btn.create_text(80, 25, text="Cancel", fill="#0a101e", font=("Helvetica Neue", 14, "bold"))
-        cancel_btn.bind("<Button-1>", lambda e: self.destroy())
-        cancel_btn.bind("<Enter>", lambda e: [cancel_btn.configure(cursor="hand2"), 
-                                             cancel_btn.itemconfig(1, fill="#94a3b8")])
-        cancel_btn.bind("<Leave>", lambda e: [cancel_btn.configure(cursor=""), 
-                                             cancel_btn.itemconfig(1, fill="#64748b")])
+        self._cancel_btn = tk.Canvas(btn_frame, width=160, height=50, bg="#0a101e", highlightthickness=0)
+        self._cancel_btn.pack(side="right", padx=(15, 0))
+        self._cancel_rect = draw_rounded_rect(self._cancel_btn, 0, 0, 160, 50, 20, fill="#64748b", outline="")
+        self._cancel_btn.create_text(80, 25, text="Cancel", fill="#0a101e", font=("Helvetica Neue", 14, "bold"))
+        self._cancel_btn.bind("<Button-1>", lambda e: self.destroy())
+        self._cancel_btn.bind("<Enter>", self._on_cancel_enter)
+        self._cancel_btn.bind("<Leave>", self._on_cancel_leave)
 
         self.bind("<Return>", lambda e: self.verify())
         self.protocol("WM_DELETE_WINDOW", self.destroy)
         self.transient(master)
         self.grab_set()
 
+    def _on_submit_enter(self, event):
+        self._submit_btn.configure(cursor="hand2")
+        self._submit_btn.itemconfig(self._submit_rect, fill="#33eaff")
+
+    def _on_submit_leave(self, event):
+        self._submit_btn.configure(cursor="")
+        self._submit_btn.itemconfig(self._submit_rect, fill="#00d4ff")
+
+    def _on_cancel_enter(self, event):
+        self._cancel_btn.configure(cursor="hand2")
+        self._cancel_btn.itemconfig(self._cancel_rect, fill="#94a3b8")
+
+    def _on_cancel_leave(self, event):
+        self._cancel_btn.configure(cursor="")
+        self._cancel_btn.itemconfig(self._cancel_rect, fill="#64748b")
+
+    def destroy(self):
+        """Drop cached attempts before closing so plaintext isn't retained."""
+        self._verify_cache.clear()
+        super().destroy()
+
     def verify(self):
         """Verify entered password, allow access or show warnings/errors."""
         password = self.entry.get()
         self.attempts += 1
         remaining = self.max_attempts - self.attempts
-        if verify_password(self.stored_hash, password):
+        ok = self._verify_cache.get(password)
+        if ok is None:
+            ok = verify_password(self.stored_digest, password)
+            if len(self._verify_cache) < 8:
+                self._verify_cache[password] = ok
+        if ok:
             self.on_success_callback()
             self.destroy()
         else:
-            self.master.after(50, lambda: self.entry.configure(bg="#ff4d4d"))
-            self.master.after(300, lambda: self.entry.configure(bg="#1e293b"))
+            self.entry.configure(bg="#ff4d4d")
+            self.master.after(250, lambda: self.entry.configure(bg="#1e293b"))
             self.itemconfig(self.attempt_label, text=f"{remaining} attempts remaining")
             if remaining == 0:
                 messagebox.showerror(
@@ -188,9 +333,14 @@ class AnimatedButton(tk.Canvas):
         self.text = text
         self.color = color
         self.command = command
+        # Hover/press fills resolved once; handlers only touch attributes
+        self._hover_fill = lighten_color(color)
+        self._press_fill = darken_color(color)
         
-        # Draw glow effect
+        # Draw glow effect: a dim stippled ring plus a hidden bright ring
+        # toggled on hover, so no stipple reconfiguration per event
         self.glow = draw_rounded_rect(self, 2, 2, width-4, height-4, 15, fill="", outline="#00d4ff", stipple="gray25")
+        self.glow_bright = draw_rounded_rect(self, 2, 2, width-4, height-4, 15, fill="", outline="#00d4ff", state="hidden")
         # Draw button
         self.rect = draw_rounded_rect(self, 0, 0, width, height, 15, fill=color, outline="")
         self.text_id = self.create_text(width/2, height/2, text=text, fill="#fff",
@@ -203,33 +353,19 @@ class AnimatedButton(tk.Canvas):
         
     def on_enter(self, event):
         self.configure(cursor="hand2")
-        self.itemconfig(self.rect, fill=self.lighten_color(self.color))
-        self.itemconfig(self.glow, stipple="")
-        
+        self.itemconfig(self.rect, fill=self._hover_fill)
+        self.itemconfigure(self.glow_bright, state="normal")
+
     def on_leave(self, event):
         self.configure(cursor="")
         self.itemconfig(self.rect, fill=self.color)
-        self.itemconfig(self.glow, stipple="gray25")
-        
+        self.itemconfigure(self.glow_bright, state="hidden")
+
     def on_click(self, event):
-        self.itemconfig(self.rect, fill=self.darken_color(self.color))
+        self.itemconfig(self.rect, fill=self._press_fill)
         self.after(100, lambda: self.itemconfig(self.rect, fill=self.color))
         if self.command:
             self.after(150, self.command)
-            
-    def lighten_color(self, color):
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        r = min(255, r + 50)
-        g = min(255, g + 50)
-        b = min(255, b + 50)
-        return f"#{r:02x}{g:02x}{b:02x}"
-        
-    def darken_color(self, color):
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        r = max(0, r - 50)
-        g = max(0, g - 50)
-        b = max(0, b - 50)
-        return f"#{r:02x}{g:02x}{b:02x}"
 
 class CalculatorApp:
     """Main calculator application with secret folder access."""
@@ -254,22 +390,32 @@ class CalculatorApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Error creating password file: {e}")
 
+        # Cache the stored hash so secret-code triggers skip disk I/O
+        self._stored_hash = None
+        try:
+            with open(self.PASSWORD_FILE, "r") as f:
+                self._stored_hash = f.read().strip()
+        except OSError:
+            pass
+
         # Create main canvas with premium gradient
         self.canvas = tk.Canvas(root, bg="#0a101e", highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
         
         # Draw gradient and glow effect
+        self._grad_cache = OrderedDict()
         self.draw_gradient()
         
         # Title
-        self.canvas.create_text(self.root.winfo_screenwidth()//2, 50, text="Premium Calculator", 
-                               fill="#00d4ff", font=("Helvetica Neue", 28, "bold"))
+        sw = self.root.winfo_screenwidth()
+        self._title_id = self.canvas.create_text(sw//2, 50, text="Premium Calculator",
+                                                fill="#00d4ff", font=("Helvetica Neue", 28, "bold"))
 
         # Create display frame with shadow
-        display_frame = tk.Frame(self.canvas, bg="#1e293b", bd=0, relief="flat", 
+        display_frame = tk.Frame(self.canvas, bg="#1e293b", bd=0, relief="flat",
                                 highlightbackground="#00d4ff", highlightthickness=2)
-        self.canvas.create_window(self.root.winfo_screenwidth()//2, 150, window=display_frame, 
-                                 width=min(800, self.root.winfo_screenwidth()-100), height=120)
+        self._display_id = self.canvas.create_window(sw//2, 150, window=display_frame,
+                                                    width=min(800, sw-100), height=120)
         
         # Display entry with glow effect
         self.display_var = tk.StringVar()
@@ -285,6 +431,8 @@ class CalculatorApp:
         self.create_buttons()
         
         # Bind secret code check and window resize
+        self._resize_after = None
+        self._last_size = None
         self.display_var.trace("w", self.check_secret_code)
         self.root.bind("<Configure>", self.on_resize)
 
@@ -298,27 +446,45 @@ class CalculatorApp:
             return
             
         self.canvas.delete("gradient")
-        
-        for i in range(height):
-            r = int(10 + (i/height)*15)
-            g = int(16 + (i/height)*20)
-            b = int(30 + (i/height)*25)
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            self.canvas.create_line(0, i, width, i, tags="gradient", fill=color)
-        
+
+        # Reuse recently rendered sizes (e.g. toggling zoomed snaps back
+        # to a size already in the cache)
+        key = (width, height)
+        img = self._grad_cache.get(key)
+        if img is None:
+            img = make_gradient_image(width, height)
+            self._grad_cache[key] = img
+            if len(self._grad_cache) > 4:
+                self._grad_cache.popitem(last=False)
+        else:
+            self._grad_cache.move_to_end(key)
+        self._grad_img = img
+        self.canvas.create_image(0, 0, anchor="nw", image=self._grad_img, tags="gradient")
+
         # Add subtle glow effect
         self.canvas.create_oval(50, 50, width-50, height-50, fill="", outline="#00d4ff", 
                                width=1, stipple="gray12", tags="gradient")
 
     def on_resize(self, event):
+        """Schedule a redraw, coalescing the burst of <Configure> events."""
+        if event.widget is not self.root:
+            return
+        size = (event.width, event.height)
+        if size == self._last_size:
+            return
+        self._last_size = size
+        if self._resize_after is not None:
+            self.root.after_cancel(self._resize_after)
+        self._resize_after = self.root.after(50, self._do_resize)
+
+    def _do_resize(self):
         """Redraw gradient and reposition elements on window resize."""
+        self._resize_after = None
         self.draw_gradient()
-        self.canvas.coords(self.canvas.find_withtag("title")[0], 
-                          self.root.winfo_screenwidth()//2, 50)
-        self.canvas.coords(self.canvas.find_withtag("display")[0], 
-                          self.root.winfo_screenwidth()//2, 150)
-        self.canvas.coords(self.canvas.find_withtag("buttons")[0], 
-                          self.root.winfo_screenwidth()//2, 450)
+        sw = self.root.winfo_screenwidth()
+        self.canvas.coords(self._title_id, sw//2, 50)
+        self.canvas.coords(self._display_id, sw//2, 150)
+        self.canvas.coords(self._buttons_id, sw//2, 450)
 
     def create_buttons(self):
         """Create calculator buttons with premium visual design."""
@@ -338,9 +504,9 @@ class CalculatorApp:
         }
         
         button_frame = tk.Frame(self.canvas, bg="#0a101e")
-        self.canvas.create_window(self.root.winfo_screenwidth()//2, 450, window=button_frame, 
-                                 width=min(800, self.root.winfo_screenwidth()-100), height=500, 
-                                 tags="buttons")
+        sw = self.root.winfo_screenwidth()
+        self._buttons_id = self.canvas.create_window(sw//2, 450, window=button_frame,
+                                                    width=min(800, sw-100), height=500)
         
         # Configure grid
         for i in range(5):
@@ -371,8 +537,8 @@ class CalculatorApp:
         """Append character to calculator display."""
         current = self.display_var.get()
         if current == "0" and text not in "+-×÷()":
-            self.display_var.set("")
-        self.display_var.set(self.display_var.get() + text)
+            current = ""
+        self.display_var.set(current + text)
 
     def clear(self):
         """Clear display and reset to zero."""
@@ -383,21 +549,15 @@ class CalculatorApp:
         expression = self.display_var.get()
         
         try:
-            if not re.match(r'^[\d+\-×÷/().\s]+$', expression):
+            if not _VALID_EXPR.match(expression):
                 messagebox.showerror("Error", "Invalid characters in expression", parent=self.root)
                 self.clear()
                 return
-                
-            expression = expression.replace('×', '*').replace('÷', '/')
-            result = eval(expression)
-            
-            if isinstance(result, float):
-                if result.is_integer():
-                    result = int(result)
-                else:
-                    result = round(result, 10)
-            
-            self.display_var.set(str(result))
+
+            result = evaluate_expression(expression.translate(_EXPR_TRANS))
+
+            # %g trims trailing zeros, so 4.0 still displays as "4"
+            self.display_var.set(f"{result:.10g}")
             
         except ZeroDivisionError:
             messagebox.showerror("Error", "Division by zero is not allowed", parent=self.root)
@@ -408,7 +568,9 @@ class CalculatorApp:
 
     def check_secret_code(self, *args):
         """Check if the display contains the secret code."""
-        if self.display_var.get().strip() == "69÷69":
+        # Cheap length/suffix prefilter; this runs on every keystroke
+        code = self.display_var.get()
+        if len(code) == 5 and code.endswith("9") and code == "69÷69":
             self.open_secret_folder()
 
     def open_secret_folder(self):
@@ -419,19 +581,18 @@ class CalculatorApp:
             )
             return
             
-        if not os.path.exists(self.PASSWORD_FILE):
+        if self._stored_hash is None:
             try:
+                default_hash = hash_password(self.DEFAULT_PASSWORD)
                 with open(self.PASSWORD_FILE, "w") as f:
-                    f.write(hash_password(self.DEFAULT_PASSWORD))
+                    f.write(default_hash)
+                self._stored_hash = default_hash
             except Exception as e:
                 messagebox.showerror("Error", f"Error creating password file: {e}")
                 return
 
-        with open(self.PASSWORD_FILE, "r") as f:
-            stored_hash = f.read().strip()
-
         self.clear()
-        PasswordWindow(self.root, stored_hash, 3, lambda: open_folder(self.SECRET_FOLDER))
+        PasswordWindow(self.root, self._stored_hash, 3, lambda: open_folder(self.SECRET_FOLDER))
 
 if __name__ == "__main__":
     root = tk.Tk()